@@ -7,11 +7,13 @@ seconds) as a background process alongside the dashboard.
 
 Configuration is read from environment variables -- see config.py.
 """
+import queue
+import signal
 import sqlite3
 import sys
+import threading
 import time
 import logging
-from datetime import datetime, timezone
 
 from pysolarmanv5 import PySolarmanV5
 
@@ -21,6 +23,93 @@ import config as cfg
 # Even the largest single-phase Solis inverter tops out well below 10 kW.
 MAX_PLAUSIBLE_POWER_W = 10_000
 
+# Upper bound on readings the writer thread folds into one transaction when
+# several have queued up behind a slow commit.
+WRITE_BATCH_SIZE = 50
+
+# Automatic WAL checkpoints are disabled (see init_db); the writer thread
+# truncates the WAL itself at most this often (seconds).
+CHECKPOINT_INTERVAL = 3600
+
+# Night-time backoff: once IDLE_GRACE_CYCLES consecutive readings show the
+# inverter idle (status 0, no power), the poll interval doubles every cycle up
+# to IDLE_MAX_BACKOFF times, capped at IDLE_MAX_SLEEP seconds. Only the first
+# idle reading of each hour is stored, as a zero baseline.
+IDLE_GRACE_CYCLES = 3
+IDLE_MAX_BACKOFF = 16
+IDLE_MAX_SLEEP = 3600
+
+# Registers are fetched in as few contiguous block reads as possible; each
+# round-trip to the data-logger stick is far more expensive than a few extra
+# registers in the response. Blocks are (start address, quantity).
+REGISTER_BLOCKS = (
+    (3004, 21),  # 3004-3024: power, energy counters, PV strings
+    (3035, 9),   # 3035-3043: AC side, temperature, frequency, status
+)
+
+
+def s16(x: int) -> int:
+    return x - 0x10000 if x > 0x7FFF else x
+
+
+def u32(hi: int, lo: int) -> int:
+    return (hi << 16) | lo
+
+
+def s32(hi: int, lo: int) -> int:
+    return int.from_bytes(u32(hi, lo).to_bytes(4, "big"), "big", signed=True)
+
+
+# Register type -> (width in registers, expression decoding the raw words
+# {0}, {1}, ...). Used to generate the decoder below.
+REGISTER_TYPES = {
+    "u16": (1, "{0}"),
+    "s16": (1, "s16({0})"),
+    "u32": (2, "({0} << 16 | {1})"),
+    "s32": (2, "s32({0}, {1})"),
+}
+
+# Field -> (register, type, scale). Based on the Solis single-phase inverter
+# documentation; every register must fall inside one of REGISTER_BLOCKS.
+REGISTER_MAP = {
+    "active_power_w":     (3004, "u16", 1),
+    "reactive_power_var": (3006, "s16", 1),
+    "energy_total_kwh":   (3008, "u32", 1),
+    "energy_today_kwh":   (3014, "u16", 0.1),
+    "pv1_voltage_v":      (3021, "u16", 0.1),
+    "pv1_current_a":      (3022, "u16", 0.1),
+    "pv2_voltage_v":      (3023, "u16", 0.1),
+    "pv2_current_a":      (3024, "u16", 0.1),
+    # AC voltage/current sit at "Phase B"/"Phase C" on single-phase Solis
+    "ac_voltage_v":       (3035, "u16", 0.1),
+    "ac_current_a":       (3038, "u16", 0.1),
+    "temperature_c":      (3041, "s16", 0.1),
+    "grid_frequency_hz":  (3042, "u16", 0.01),
+    "status":             (3043, "u16", 1),
+}
+
+
+def build_decoder(register_map: dict):
+    """Generate a function mapping {address: raw word} to decoded fields.
+
+    The register map is unrolled once into straight-line source (constant
+    subscripts, no per-field type dispatch or scale lookups) and compiled.
+    """
+    lines = ["def decode(regs):", "    return {"]
+    for field, (addr, kind, scale) in register_map.items():
+        width, template = REGISTER_TYPES[kind]
+        expr = template.format(*(f"regs[{addr + i}]" for i in range(width)))
+        if scale != 1:
+            expr = f"{expr} * {scale!r}"
+        lines.append(f"        {field!r}: {expr},")
+    lines.append("    }")
+    namespace = {"s16": s16, "s32": s32}
+    exec(compile("\n".join(lines), "<register decoder>", "exec"), namespace)
+    return namespace["decode"]
+
+
+decode_registers = build_decoder(REGISTER_MAP)
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -37,9 +126,21 @@ def init_db(db_path: str) -> sqlite3.Connection:
     """Create the database and tables if they don't exist."""
     conn = sqlite3.connect(db_path)
     conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    # No commit ever pays for a checkpoint; writer_loop runs them on a schedule.
+    conn.execute("PRAGMA wal_autocheckpoint=0")
+    # NORMAL is durable across application crashes in WAL mode and skips the
+    # per-commit fsync of the WAL file that FULL would issue.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-20000")
+    # Plain INTEGER PRIMARY KEY: rows are never deleted, so rowids stay
+    # monotonic without AUTOINCREMENT's extra sqlite_sequence write per insert.
+    # Databases created with AUTOINCREMENT keep working unchanged.
     conn.execute("""
         CREATE TABLE IF NOT EXISTS readings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER PRIMARY KEY,
             timestamp TEXT NOT NULL,
             active_power_w REAL,
             reactive_power_var REAL,
@@ -53,9 +154,17 @@ def init_db(db_path: str) -> sqlite3.Connection:
             temperature_c REAL,
             energy_today_kwh REAL,
             energy_total_kwh REAL,
-            status INTEGER
+            status INTEGER,
+            date TEXT GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL
         )
     """)
+    # Databases created before the generated date column existed.
+    columns = {r[1] for r in conn.execute("PRAGMA table_xinfo(readings)")}
+    if "date" not in columns:
+        conn.execute("""
+            ALTER TABLE readings ADD COLUMN
+            date TEXT GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL
+        """)
     conn.execute("""
         CREATE TABLE IF NOT EXISTS daily_summary (
             date TEXT PRIMARY KEY,
@@ -66,10 +175,30 @@ def init_db(db_path: str) -> sqlite3.Connection:
             generation_hours REAL
         )
     """)
+    # Hourly pre-aggregation of readings, maintained by the collector so the
+    # dashboard's hourly/daily charts do not re-scan the raw table.
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS readings_hourly (
+            hour TEXT PRIMARY KEY,
+            avg_power REAL,
+            peak_power REAL,
+            avg_pv1_v REAL,
+            avg_ac_v REAL,
+            avg_temp REAL,
+            max_energy_today REAL,
+            reading_count INTEGER
+        )
+    """)
     conn.execute("""
         CREATE INDEX IF NOT EXISTS idx_readings_timestamp
         ON readings (timestamp)
     """)
+    # Serves the per-day filters and GROUP BY date used by the daily summary
+    # and the dashboard's aggregate queries.
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_readings_date
+        ON readings (date, active_power_w DESC)
+    """)
     conn.commit()
     return conn
 
@@ -78,86 +207,69 @@ def init_db(db_path: str) -> sqlite3.Connection:
 # Inverter communication
 # ---------------------------------------------------------------------------
 
+# The SolarMAN V5 client is kept open across poll cycles so each poll does not
+# pay for a fresh TCP connect and V5 handshake. It is dropped on any error and
+# re-created lazily on the next read.
+_client: PySolarmanV5 | None = None
+
+
+def _get_client() -> PySolarmanV5:
+    global _client
+    if _client is None:
+        _client = PySolarmanV5(
+            address=cfg.INVERTER_IP,
+            serial=cfg.LOGGER_SERIAL,
+            port=cfg.MODBUS_PORT,
+            mb_slave_id=cfg.SLAVE_ID,
+            verbose=False,
+            socket_timeout=10,
+        )
+    return _client
+
+
+def _drop_client() -> None:
+    global _client
+    if _client is not None:
+        try:
+            _client.disconnect()
+        except Exception:
+            pass
+        _client = None
+
+
+def _read_registers() -> dict[int, int]:
+    """Fetch every register in REGISTER_BLOCKS, keyed by register address."""
+    modbus = _get_client()
+    regs: dict[int, int] = {}
+    for i, (start, quantity) in enumerate(REGISTER_BLOCKS):
+        if i:
+            time.sleep(0.3)
+        r = modbus.read_input_registers(register_addr=start, quantity=quantity)
+        regs.update(zip(range(start, start + quantity), r))
+    return regs
+
+
 def read_inverter() -> dict:
     """Read all relevant Modbus registers from the inverter.
 
     Register map is based on the Solis single-phase inverter documentation.
     Tested on a Solis-mini-2000-4G with SolarMAN V5 data-logger stick.
     """
-    modbus = PySolarmanV5(
-        address=cfg.INVERTER_IP,
-        serial=cfg.LOGGER_SERIAL,
-        port=cfg.MODBUS_PORT,
-        mb_slave_id=cfg.SLAVE_ID,
-        verbose=False,
-        socket_timeout=10,
-    )
-
-    data: dict = {}
     try:
-        # Active Power (reg 3004, uint16)
-        r = modbus.read_input_registers(register_addr=3004, quantity=1)
-        data["active_power_w"] = r[0]
-        time.sleep(0.3)
-
-        # Reactive Power (reg 3006, int16)
-        r = modbus.read_input_registers(register_addr=3006, quantity=1)
-        val = r[0]
-        data["reactive_power_var"] = val - 65536 if val > 32767 else val
-        time.sleep(0.3)
-
-        # PV1 Voltage & Current (reg 3021-3022)
-        r = modbus.read_input_registers(register_addr=3021, quantity=2)
-        data["pv1_voltage_v"] = r[0] * 0.1
-        data["pv1_current_a"] = r[1] * 0.1
-        time.sleep(0.3)
-
-        # PV2 Voltage & Current (reg 3023-3024)
-        r = modbus.read_input_registers(register_addr=3023, quantity=2)
-        data["pv2_voltage_v"] = r[0] * 0.1
-        data["pv2_current_a"] = r[1] * 0.1
-        time.sleep(0.3)
-
-        # AC Voltage (reg 3035 -- "Phase B" on single-phase Solis)
-        r = modbus.read_input_registers(register_addr=3035, quantity=1)
-        data["ac_voltage_v"] = r[0] * 0.1
-        time.sleep(0.3)
-
-        # AC Current (reg 3038 -- "Phase C" on single-phase Solis)
-        r = modbus.read_input_registers(register_addr=3038, quantity=1)
-        data["ac_current_a"] = r[0] * 0.1
-        time.sleep(0.3)
-
-        # Temperature (reg 3041, int16, x0.1)
-        r = modbus.read_input_registers(register_addr=3041, quantity=1)
-        val = r[0]
-        data["temperature_c"] = (val - 65536 if val > 32767 else val) * 0.1
-        time.sleep(0.3)
-
-        # Grid Frequency (reg 3042, x0.01)
-        r = modbus.read_input_registers(register_addr=3042, quantity=1)
-        data["grid_frequency_hz"] = r[0] * 0.01
-        time.sleep(0.3)
-
-        # Energy Today (reg 3014, x0.1)
-        r = modbus.read_input_registers(register_addr=3014, quantity=1)
-        data["energy_today_kwh"] = r[0] * 0.1
-        time.sleep(0.3)
-
-        # Total Energy (reg 3008, uint32)
-        r = modbus.read_input_registers(register_addr=3008, quantity=2)
-        data["energy_total_kwh"] = (r[0] << 16) + r[1]
-        time.sleep(0.3)
-
-        # Operating Status (reg 3043)
-        r = modbus.read_input_registers(register_addr=3043, quantity=1)
-        data["status"] = r[0]
-
+        try:
+            regs = _read_registers()
+        except Exception as exc:
+            # The cached connection may have been closed by the logger stick
+            # (they drop idle sockets); reconnect and retry once.
+            log.warning("Inverter read failed (%s), reconnecting", exc)
+            _drop_client()
+            regs = _read_registers()
     except Exception as exc:
         log.error("Error reading inverter: %s", exc)
+        _drop_client()
         raise
-    finally:
-        modbus.disconnect()
+
+    data = decode_registers(regs)
 
     # Register 3004 (active power) returns 0 at low-to-medium output on some
     # Solis firmware versions. Fall back to V×I from the AC side, which is
@@ -174,9 +286,8 @@ def read_inverter() -> dict:
 # Storage helpers
 # ---------------------------------------------------------------------------
 
-def store_reading(conn: sqlite3.Connection, data: dict) -> None:
-    """Insert a single reading row."""
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+def store_reading(conn: sqlite3.Connection, timestamp: str, data: dict) -> None:
+    """Insert a single reading row. The caller is responsible for committing."""
     conn.execute(
         """
         INSERT INTO readings (
@@ -187,7 +298,7 @@ def store_reading(conn: sqlite3.Connection, data: dict) -> None:
         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
-            now,
+            timestamp,
             data.get("active_power_w"),
             data.get("reactive_power_var"),
             data.get("pv1_voltage_v"),
@@ -203,7 +314,6 @@ def store_reading(conn: sqlite3.Connection, data: dict) -> None:
             data.get("status"),
         ),
     )
-    conn.commit()
     log.info(
         "Stored: %sW | PV1: %.1fV/%.1fA | Today: %.1fkWh | Total: %skWh",
         data.get("active_power_w", 0),
@@ -221,45 +331,72 @@ def upsert_daily_summary_for_date(conn: sqlite3.Connection, date: str) -> None:
     but does NOT require active_power_w > 0 — the inverter's accumulated daily
     energy counter is reliable even when instantaneous power reads as zero.
     generation_hours counts only intervals where active_power_w > 0.
+    The caller is responsible for committing.
     """
+    # Day-wide aggregates are computed as whole-partition window functions so
+    # the same single pass also yields the timestamp of the peak row.
     row = conn.execute(
         """
         SELECT
-            MAX(energy_today_kwh),
-            MAX(CASE WHEN active_power_w > 0 THEN active_power_w
-                     ELSE ac_voltage_v * ac_current_a END),
-            AVG(temperature_c),
-            SUM(CASE WHEN active_power_w > 0 OR ac_current_a > 0.1 THEN 1 ELSE 0 END) * ? / 3600.0
-        FROM readings
-        WHERE date(timestamp) = ?
+            MAX(energy_today_kwh) OVER day,
+            MAX(power) OVER day,
+            AVG(temperature_c) OVER day,
+            SUM(CASE WHEN active_power_w > 0 OR ac_current_a > 0.1 THEN 1 ELSE 0 END) OVER day * ? / 3600.0,
+            timestamp
+        FROM (
+            SELECT timestamp, energy_today_kwh, temperature_c, active_power_w, ac_current_a,
+                   CASE WHEN active_power_w > 0 THEN active_power_w
+                        ELSE ac_voltage_v * ac_current_a END AS power
+            FROM readings
+            WHERE date = ?
+        )
+        WINDOW day AS ()
+        ORDER BY power DESC
+        LIMIT 1
         """,
         (cfg.POLL_INTERVAL, date),
     ).fetchone()
 
     if row and row[0] is not None and row[0] > 0:
-        peak_row = conn.execute(
-            """
-            SELECT timestamp FROM readings WHERE date(timestamp) = ?
-            ORDER BY CASE WHEN active_power_w > 0 THEN active_power_w
-                          ELSE ac_voltage_v * ac_current_a END DESC LIMIT 1
-            """,
-            (date,),
-        ).fetchone()
         conn.execute(
             """
             INSERT OR REPLACE INTO daily_summary
                 (date, energy_kwh, peak_power_w, peak_power_time, avg_temperature_c, generation_hours)
             VALUES (?, ?, ?, ?, ?, ?)
             """,
-            (date, row[0], row[1], peak_row[0] if peak_row else None, row[2], row[3]),
+            (date, row[0], row[1], row[4], row[2], row[3]),
         )
-        conn.commit()
 
 
-def update_daily_summary(conn: sqlite3.Connection) -> None:
-    """Upsert the daily summary row for today."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    upsert_daily_summary_for_date(conn, today)
+def upsert_hourly_rollups_since(conn: sqlite3.Connection, since: str) -> None:
+    """Recompute readings_hourly for every hour with readings at or after
+    `since` (a timestamp string; "" for all history).
+
+    Power uses the same V×I fallback as the daily summary for rows where the
+    active power register read zero. The caller is responsible for committing.
+    """
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO readings_hourly
+            (hour, avg_power, peak_power, avg_pv1_v, avg_ac_v, avg_temp,
+             max_energy_today, reading_count)
+        SELECT
+            strftime('%Y-%m-%dT%H:00:00Z', timestamp) AS h,
+            AVG(CASE WHEN active_power_w > 0 THEN active_power_w
+                     ELSE ac_voltage_v * ac_current_a END),
+            MAX(CASE WHEN active_power_w > 0 THEN active_power_w
+                     ELSE ac_voltage_v * ac_current_a END),
+            AVG(pv1_voltage_v),
+            AVG(ac_voltage_v),
+            AVG(temperature_c),
+            MAX(energy_today_kwh),
+            COUNT(*)
+        FROM readings
+        WHERE timestamp >= ?
+        GROUP BY h
+        """,
+        (since,),
+    )
 
 
 def backfill_daily_summaries(conn: sqlite3.Connection) -> None:
@@ -269,19 +406,130 @@ def backfill_daily_summaries(conn: sqlite3.Connection) -> None:
     """
     missing = conn.execute(
         """
-        SELECT DISTINCT date(timestamp) AS d
-        FROM readings
-        WHERE date(timestamp) < date('now', 'utc')
-          AND date(timestamp) NOT IN (SELECT date FROM daily_summary)
-        ORDER BY d
+        SELECT DISTINCT r.date
+        FROM readings r
+        WHERE r.date < date('now', 'utc')
+          AND r.date NOT IN (SELECT s.date FROM daily_summary s)
+        ORDER BY r.date
         """
     ).fetchall()
 
     for (date,) in missing:
-        upsert_daily_summary_for_date(conn, date)
+        with conn:
+            upsert_daily_summary_for_date(conn, date)
         log.info("Backfilled daily summary for %s", date)
 
 
+def refresh_recent_daily_summaries(conn: sqlite3.Connection) -> None:
+    """Recompute the latest daily summary and every later date with readings.
+
+    The writer only refreshes daily_summary on a new hour or a new peak, so a
+    collector stopped mid-hour can leave its last day's summary behind the
+    raw readings. Called at startup, after the backfill, to catch that day up.
+    """
+    dates = conn.execute(
+        """
+        SELECT DISTINCT date FROM readings
+        WHERE date >= (SELECT COALESCE(MAX(date), '') FROM daily_summary)
+        ORDER BY date
+        """
+    ).fetchall()
+    with conn:
+        for (date,) in dates:
+            upsert_daily_summary_for_date(conn, date)
+
+
+def backfill_hourly_rollups(conn: sqlite3.Connection) -> None:
+    """Rebuild readings_hourly from its latest stored hour onwards (or from
+    scratch when empty). Called at startup alongside the daily backfill.
+    """
+    (latest,) = conn.execute("SELECT MAX(hour) FROM readings_hourly").fetchone()
+    with conn:
+        upsert_hourly_rollups_since(conn, latest or "")
+    if latest is None:
+        log.info("Built hourly rollups from existing readings")
+
+
+# ---------------------------------------------------------------------------
+# Writer thread
+# ---------------------------------------------------------------------------
+
+# Sentinel put on the write queue to make the writer flush and exit.
+_STOP = object()
+
+
+def writer_loop(db_path: str, writes: queue.Queue) -> None:
+    """Own the SQLite connection and persist queued (timestamp, data) readings.
+
+    Runs on its own thread so Modbus polling never waits on a commit/fsync.
+    Whatever has queued up is drained (up to WRITE_BATCH_SIZE) and written in
+    one transaction together with the hourly rollup refresh.
+
+    The daily summary aggregates the whole day, so it is only recomputed when
+    a batch crosses into a new hour or carries a new peak for the day; on a
+    date change the previous day is finalised first. Every CHECKPOINT_INTERVAL
+    the WAL is checkpointed and truncated.
+    """
+    conn = init_db(db_path)
+    backfill_daily_summaries(conn)
+    refresh_recent_daily_summaries(conn)
+    backfill_hourly_rollups(conn)
+
+    summary_hour = None  # YYYY-MM-DDTHH of the last daily summary update
+    peak_power = 0.0     # highest active power seen on that day
+    last_checkpoint = time.monotonic()
+
+    stop = False
+    while not stop:
+        batch = [writes.get()]
+        while len(batch) < WRITE_BATCH_SIZE:
+            try:
+                batch.append(writes.get_nowait())
+            except queue.Empty:
+                break
+        stop = _STOP in batch
+        readings = [item for item in batch if item is not _STOP]
+        if not readings:
+            continue
+
+        hour = readings[-1][0][:13]
+        new_day = summary_hour is not None and summary_hour[:10] != hour[:10]
+        batch_peak = max(
+            (data.get("active_power_w") or 0 for ts, data in readings if ts[:10] == hour[:10]),
+            default=0,
+        )
+        refresh_summary = hour != summary_hour or batch_peak > peak_power
+        # Every date touched by this batch, plus the day last summarised so
+        # that it is finalised when the date rolls over.
+        dates = {ts[:10] for ts, _ in readings}
+        if summary_hour is not None:
+            dates.add(summary_hour[:10])
+        try:
+            with conn:
+                for timestamp, data in readings:
+                    store_reading(conn, timestamp, data)
+                upsert_hourly_rollups_since(conn, readings[0][0][:13] + ":00:00Z")
+                if refresh_summary:
+                    for date in sorted(dates):
+                        upsert_daily_summary_for_date(conn, date)
+        except Exception as exc:
+            log.error("Write failed, %d reading(s) dropped: %s", len(readings), exc)
+            continue
+
+        if refresh_summary:
+            peak_power = max(0.0 if new_day else peak_power, batch_peak)
+            summary_hour = hour
+
+        if time.monotonic() - last_checkpoint >= CHECKPOINT_INTERVAL:
+            busy, _, _ = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+            if busy:
+                log.warning("WAL checkpoint blocked by readers; retrying next batch")
+            else:
+                last_checkpoint = time.monotonic()
+
+    conn.close()
+
+
 # ---------------------------------------------------------------------------
 # Main loop
 # ---------------------------------------------------------------------------
@@ -291,8 +539,14 @@ def main() -> None:
         log.error("INVERTER_IP and LOGGER_SERIAL must be set. See .env.example.")
         sys.exit(1)
 
-    conn = init_db(cfg.DB_PATH)
-    backfill_daily_summaries(conn)
+    writes: queue.Queue = queue.Queue()
+    writer = threading.Thread(
+        target=writer_loop, args=(cfg.DB_PATH, writes), name="writer", daemon=True
+    )
+    writer.start()
+    # Turn SIGTERM (forwarded by start.sh on `docker stop`) into a normal exit
+    # so queued readings get flushed.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
 
     log.info("Solar Monitor Collector started")
     log.info("  Inverter : %s:%s", cfg.INVERTER_IP, cfg.MODBUS_PORT)
@@ -300,28 +554,54 @@ def main() -> None:
     log.info("  Interval : %ss", cfg.POLL_INTERVAL)
     log.info("  Database : %s", cfg.DB_PATH)
 
-    while True:
-        try:
-            data = read_inverter()
-
-            # Sanity check: discard obviously bogus readings that can occur
-            # when registers are misread or the inverter returns garbage.
-            power = data.get("active_power_w", 0)
-            if power > MAX_PLAUSIBLE_POWER_W:
-                log.warning(
-                    "Reading discarded: active_power_w=%s exceeds %sW limit",
-                    power,
-                    MAX_PLAUSIBLE_POWER_W,
-                )
-                time.sleep(cfg.POLL_INTERVAL)
-                continue
-
-            store_reading(conn, data)
-            update_daily_summary(conn)
-        except Exception as exc:
-            log.error("Collection cycle failed: %s", exc)
-
-        time.sleep(cfg.POLL_INTERVAL)
+    idle_streak = 0
+    last_idle_hour = None
+    try:
+        while True:
+            if not writer.is_alive():
+                log.error("Database writer thread died; exiting")
+                sys.exit(1)
+            delay = cfg.POLL_INTERVAL
+            try:
+                data = read_inverter()
+                # Stamped at read time: the row may only be inserted later by
+                # the writer thread.
+                timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+                # Sanity check: discard obviously bogus readings that can occur
+                # when registers are misread or the inverter returns garbage.
+                power = data.get("active_power_w", 0)
+                if power > MAX_PLAUSIBLE_POWER_W:
+                    log.warning(
+                        "Reading discarded: active_power_w=%s exceeds %sW limit",
+                        power,
+                        MAX_PLAUSIBLE_POWER_W,
+                    )
+                    time.sleep(delay)
+                    continue
+
+                if power or data.get("status"):
+                    idle_streak = 0
+                    last_idle_hour = None
+                    writes.put((timestamp, data))
+                else:
+                    idle_streak += 1
+                    backoff = 2 ** max(0, idle_streak - IDLE_GRACE_CYCLES)
+                    delay = min(delay * min(backoff, IDLE_MAX_BACKOFF), max(delay, IDLE_MAX_SLEEP))
+                    hour = timestamp[:13]
+                    if hour != last_idle_hour:
+                        last_idle_hour = hour
+                        writes.put((timestamp, data))
+                    else:
+                        log.info("Inverter idle, reading skipped (next poll in %ss)", delay)
+            except Exception as exc:
+                log.error("Collection cycle failed: %s", exc)
+
+            time.sleep(delay)
+    finally:
+        writes.put(_STOP)
+        # Stay inside docker stop's default 10s grace period.
+        writer.join(timeout=5)
 
 
 if __name__ == "__main__":
@@ -6,22 +6,219 @@ for solar generation data collected by the companion collector process.
 
 Configuration is read from environment variables -- see config.py.
 """
+import functools
 import sqlite3
+import threading
 from datetime import datetime, timedelta, timezone
 
-from flask import Flask, jsonify, render_template, request
+import numpy as np
+import orjson
+from flask import Flask, Response, render_template, request, stream_with_context
 
 import config as cfg
 
 app = Flask(__name__)
 
+_local = threading.local()
+
 
 def get_db() -> sqlite3.Connection:
-    conn = sqlite3.connect(cfg.DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """Read-only connection, opened once per worker thread and reused.
+
+    Keeping the connection alive across requests lets sqlite3's statement
+    cache hold the prepared form of the module-level queries below.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(cfg.DB_PATH, cached_statements=256)
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        _local.conn = conn
     return conn
 
 
+def json_response(obj) -> Response:
+    return Response(orjson.dumps(obj), mimetype="application/json")
+
+
+def columns(cursor: sqlite3.Cursor) -> list[str]:
+    return [d[0] for d in cursor.description]
+
+
+def fetch_one(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> dict | None:
+    cursor = conn.execute(sql, params)
+    row = cursor.fetchone()
+    return dict(zip(columns(cursor), row)) if row else None
+
+
+def encode_rows(cursor: sqlite3.Cursor, rows: list[tuple], columnar: bool = False) -> bytes:
+    """JSON-encode result rows as a list of objects or, with columnar=True, as
+    {"cols": [...], "rows": [[...], ...]} which skips building a dict per row.
+    """
+    cols = columns(cursor)
+    if columnar:
+        return orjson.dumps({"cols": cols, "rows": rows})
+    return orjson.dumps([dict(zip(cols, r)) for r in rows])
+
+
+def stream_rows(cursor: sqlite3.Cursor, batch_size: int = 500) -> Response:
+    """Stream a cursor's rows as a JSON array without building the full list."""
+    def generate():
+        sep = b"["
+        while rows := cursor.fetchmany(batch_size):
+            yield sep + encode_rows(cursor, rows)[1:-1]
+            sep = b","
+        yield b"[]" if sep == b"[" else b"]"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick n_out indices that preserve the visual shape of (x, y).
+
+    Largest-Triangle-Three-Buckets: the first and last points are kept, the
+    rest are split into n_out - 2 buckets and from each the point forming the
+    largest triangle with the previously chosen point and the next bucket's
+    mean is selected. The per-bucket area computation is vectorised.
+    """
+    n = len(x)
+    if n_out < 3 or n_out >= n:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    out = np.empty(n_out, dtype=int)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        cx, cy = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs(
+            (x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a])
+        )
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+# ---------------------------------------------------------------------------
+# SQL
+# ---------------------------------------------------------------------------
+
+# active_power_w from register 3004 reads as 0 on some Solis firmware
+# versions even when generating. Fall back to V×I (apparent ≈ active for
+# PF ≥ 0.99 grid-tie inverters) for rows where the register was zero.
+POWER_EXPR = """CASE WHEN active_power_w > 0 THEN active_power_w
+                     ELSE ac_voltage_v * ac_current_a END"""
+
+SQL_LATEST = "SELECT * FROM readings ORDER BY timestamp DESC LIMIT 1"
+
+# Newest rollup row, read through the primary key. The collector re-upserts
+# from each batch's first hour, so every write bumps this row's reading_count
+# or adds a newer hour, and a rebuild from scratch turns NULL into a row.
+SQL_ROLLUP_VERSION = (
+    "SELECT hour, reading_count FROM readings_hourly ORDER BY hour DESC LIMIT 1"
+)
+
+SQL_TODAY = """
+    SELECT timestamp, active_power_w, pv1_voltage_v, pv1_current_a,
+           ac_voltage_v, temperature_c, energy_today_kwh
+    FROM readings WHERE date = date('now') ORDER BY timestamp
+"""
+
+# Hourly and daily history come from the collector's readings_hourly rollup.
+# Daily averages are weighted by each hour's reading count so they match an
+# average over the raw readings.
+SQL_HISTORY_HOURLY = """
+    SELECT hour             AS timestamp,
+           avg_power        AS active_power_w,
+           peak_power       AS peak_power_w,
+           avg_pv1_v        AS pv1_voltage_v,
+           avg_ac_v         AS ac_voltage_v,
+           avg_temp         AS temperature_c,
+           max_energy_today AS energy_today_kwh
+    FROM readings_hourly
+    WHERE hour >= ? AND hour < date(?, '+1 day')
+    ORDER BY hour
+"""
+
+SQL_HISTORY_DAILY = """
+    SELECT substr(hour, 1, 10) AS timestamp,
+           SUM(avg_power * reading_count) / SUM(reading_count) AS active_power_w,
+           MAX(peak_power)        AS peak_power_w,
+           SUM(avg_pv1_v * reading_count) / SUM(reading_count) AS pv1_voltage_v,
+           SUM(avg_temp * reading_count) / SUM(reading_count)  AS temperature_c,
+           MAX(max_energy_today)  AS energy_today_kwh
+    FROM readings_hourly
+    WHERE hour >= ? AND hour < date(?, '+1 day')
+    GROUP BY substr(hour, 1, 10)
+    ORDER BY timestamp
+"""
+
+SQL_HISTORY_RAW = f"""
+    SELECT timestamp,
+           ROUND({POWER_EXPR}) AS active_power_w,
+           pv1_voltage_v, pv1_current_a,
+           ac_voltage_v, temperature_c, energy_today_kwh
+    FROM readings
+    WHERE date >= ? AND date <= ?
+    ORDER BY timestamp
+"""
+
+SQL_DAILY_SUMMARY = "SELECT * FROM daily_summary ORDER BY date DESC LIMIT ?"
+
+SQL_DAILY_SUMMARY_FALLBACK = """
+    SELECT date,
+           MAX(energy_today_kwh) AS energy_kwh,
+           MAX(active_power_w)   AS peak_power_w,
+           NULL                  AS peak_power_time,
+           AVG(temperature_c)    AS avg_temperature_c,
+           SUM(CASE WHEN active_power_w > 0 THEN 1 ELSE 0 END) * ? / 3600.0 AS generation_hours
+    FROM readings WHERE energy_today_kwh > 0
+    GROUP BY date
+    ORDER BY date DESC LIMIT ?
+"""
+
+SQL_STATS_TODAY = """
+    SELECT MAX(energy_today_kwh) AS energy_today,
+           MAX(active_power_w)   AS peak_power_today,
+           AVG(temperature_c)    AS avg_temp_today,
+           COUNT(*)              AS readings_today
+    FROM readings WHERE date = date('now')
+"""
+
+SQL_STATS_ALL_TIME = """
+    SELECT COUNT(*) AS total_readings,
+           MIN(timestamp) AS first_reading,
+           MAX(timestamp) AS last_reading,
+           MAX(active_power_w) AS all_time_peak_power
+    FROM readings
+"""
+
+SQL_STATS_LAST_7_DAYS = """
+    SELECT date, MAX(energy_today_kwh) AS energy_kwh
+    FROM readings GROUP BY date
+    ORDER BY date DESC LIMIT 7
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def cached_aggregate(
+    sql: str, start: str, end: str, version: tuple | None, columnar: bool
+) -> bytes:
+    """Encoded result of an aggregate history query, kept in-process.
+
+    `version` is the newest readings_hourly row (SQL_ROLLUP_VERSION), a
+    single index lookup, and only serves as part of the cache key: once the
+    collector updates or rebuilds the rollup, lookups miss and the stale
+    entries age out of the LRU.
+    """
+    cursor = get_db().execute(sql, (start, end))
+    return encode_rows(cursor, cursor.fetchall(), columnar)
+
+
 # ---------------------------------------------------------------------------
 # Pages
 # ---------------------------------------------------------------------------
@@ -38,27 +235,13 @@ def index():
 @app.route("/api/live")
 def api_live():
     """Most recent reading."""
-    conn = get_db()
-    row = conn.execute("SELECT * FROM readings ORDER BY timestamp DESC LIMIT 1").fetchone()
-    conn.close()
-    return jsonify(dict(row) if row else {})
+    return json_response(fetch_one(get_db(), SQL_LATEST) or {})
 
 
 @app.route("/api/today")
 def api_today():
     """All readings for today (UTC)."""
-    conn = get_db()
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    rows = conn.execute(
-        """
-        SELECT timestamp, active_power_w, pv1_voltage_v, pv1_current_a,
-               ac_voltage_v, temperature_c, energy_today_kwh
-        FROM readings WHERE date(timestamp) = ? ORDER BY timestamp
-        """,
-        (today,),
-    ).fetchall()
-    conn.close()
-    return jsonify([dict(r) for r in rows])
+    return stream_rows(get_db().execute(SQL_TODAY))
 
 
 @app.route("/api/history")
@@ -69,68 +252,31 @@ def api_history():
         start      -- YYYY-MM-DD (default: 7 days ago)
         end        -- YYYY-MM-DD (default: today)
         resolution -- raw | hourly | daily (default: raw)
+        max_points -- raw only: downsample to at most this many points with
+                      LTTB (default: 500, 0 disables)
+        format     -- objects | columns (default: objects); columns returns
+                      {"cols": [...], "rows": [[...], ...]}
     """
     start = request.args.get("start") or (datetime.now(timezone.utc) - timedelta(days=7)).strftime("%Y-%m-%d")
     end = request.args.get("end") or datetime.now(timezone.utc).strftime("%Y-%m-%d")
     resolution = request.args.get("resolution", "raw")
+    columnar = request.args.get("format") == "columns"
 
-    conn = get_db()
+    if resolution in ("hourly", "daily"):
+        sql = SQL_HISTORY_HOURLY if resolution == "hourly" else SQL_HISTORY_DAILY
+        version = get_db().execute(SQL_ROLLUP_VERSION).fetchone()
+        body = cached_aggregate(sql, start, end, version, columnar)
+        return Response(body, mimetype="application/json")
 
-    # active_power_w from register 3004 reads as 0 on some Solis firmware
-    # versions even when generating. Fall back to V×I (apparent ≈ active for
-    # PF ≥ 0.99 grid-tie inverters) for rows where the register was zero.
-    POWER_EXPR = """CASE WHEN active_power_w > 0 THEN active_power_w
-                         ELSE ac_voltage_v * ac_current_a END"""
-
-    if resolution == "hourly":
-        rows = conn.execute(
-            f"""
-            SELECT strftime('%Y-%m-%dT%H:00:00Z', timestamp) AS timestamp,
-                   AVG({POWER_EXPR})  AS active_power_w,
-                   MAX({POWER_EXPR})  AS peak_power_w,
-                   AVG(pv1_voltage_v) AS pv1_voltage_v,
-                   AVG(ac_voltage_v)  AS ac_voltage_v,
-                   AVG(temperature_c) AS temperature_c,
-                   MAX(energy_today_kwh) AS energy_today_kwh
-            FROM readings
-            WHERE date(timestamp) >= ? AND date(timestamp) <= ?
-            GROUP BY strftime('%Y-%m-%dT%H', timestamp)
-            ORDER BY timestamp
-            """,
-            (start, end),
-        ).fetchall()
-    elif resolution == "daily":
-        rows = conn.execute(
-            f"""
-            SELECT date(timestamp) AS timestamp,
-                   AVG({POWER_EXPR})  AS active_power_w,
-                   MAX({POWER_EXPR})  AS peak_power_w,
-                   AVG(pv1_voltage_v) AS pv1_voltage_v,
-                   AVG(temperature_c) AS temperature_c,
-                   MAX(energy_today_kwh) AS energy_today_kwh
-            FROM readings
-            WHERE date(timestamp) >= ? AND date(timestamp) <= ?
-            GROUP BY date(timestamp)
-            ORDER BY timestamp
-            """,
-            (start, end),
-        ).fetchall()
-    else:
-        rows = conn.execute(
-            f"""
-            SELECT timestamp,
-                   ROUND({POWER_EXPR}) AS active_power_w,
-                   pv1_voltage_v, pv1_current_a,
-                   ac_voltage_v, temperature_c, energy_today_kwh
-            FROM readings
-            WHERE date(timestamp) >= ? AND date(timestamp) <= ?
-            ORDER BY timestamp
-            """,
-            (start, end),
-        ).fetchall()
-
-    conn.close()
-    return jsonify([dict(r) for r in rows])
+    max_points = int(request.args.get("max_points", 500))
+    cursor = get_db().execute(SQL_HISTORY_RAW, (start, end))
+    rows = cursor.fetchall()
+    if 0 < max_points < len(rows):
+        # SQL_HISTORY_RAW selects timestamp, active_power_w first.
+        x = np.array([r[0][:19] for r in rows], dtype="datetime64[s]").astype(float)
+        y = np.array([r[1] or 0 for r in rows], dtype=float)
+        rows = [rows[i] for i in lttb_indices(x, y, max_points)]
+    return Response(encode_rows(cursor, rows, columnar), mimetype="application/json")
 
 
 @app.route("/api/daily_summary")
@@ -143,28 +289,16 @@ def api_daily_summary():
     days = int(request.args.get("days", 30))
     conn = get_db()
 
-    rows = conn.execute(
-        "SELECT * FROM daily_summary ORDER BY date DESC LIMIT ?", (days,)
-    ).fetchall()
+    cursor = conn.execute(SQL_DAILY_SUMMARY, (days,))
+    rows = cursor.fetchall()
 
     if not rows:
-        rows = conn.execute(
-            f"""
-            SELECT date(timestamp) AS date,
-                   MAX(energy_today_kwh) AS energy_kwh,
-                   MAX(active_power_w)   AS peak_power_w,
-                   NULL                  AS peak_power_time,
-                   AVG(temperature_c)    AS avg_temperature_c,
-                   SUM(CASE WHEN active_power_w > 0 THEN 1 ELSE 0 END) * {int(cfg.POLL_INTERVAL)} / 3600.0 AS generation_hours
-            FROM readings WHERE energy_today_kwh > 0
-            GROUP BY date(timestamp)
-            ORDER BY date DESC LIMIT ?
-            """,
-            (days,),
-        ).fetchall()
-
-    conn.close()
-    return jsonify([dict(r) for r in rows])
+        cursor = conn.execute(
+            SQL_DAILY_SUMMARY_FALLBACK, (int(cfg.POLL_INTERVAL), days)
+        )
+        rows = cursor.fetchall()
+
+    return Response(encode_rows(cursor, rows), mimetype="application/json")
 
 
 @app.route("/api/stats")
@@ -173,47 +307,23 @@ def api_stats():
     conn = get_db()
     stats: dict = {}
 
-    row = conn.execute("SELECT * FROM readings ORDER BY timestamp DESC LIMIT 1").fetchone()
+    row = fetch_one(conn, SQL_LATEST)
     if row:
-        stats["current"] = dict(row)
-
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    row = conn.execute(
-        """
-        SELECT MAX(energy_today_kwh) AS energy_today,
-               MAX(active_power_w)   AS peak_power_today,
-               AVG(temperature_c)    AS avg_temp_today,
-               COUNT(*)              AS readings_today
-        FROM readings WHERE date(timestamp) = ?
-        """,
-        (today,),
-    ).fetchone()
+        stats["current"] = row
+
+    row = fetch_one(conn, SQL_STATS_TODAY)
     if row:
-        stats["today"] = dict(row)
-
-    row = conn.execute(
-        """
-        SELECT COUNT(*) AS total_readings,
-               MIN(timestamp) AS first_reading,
-               MAX(timestamp) AS last_reading,
-               MAX(active_power_w) AS all_time_peak_power
-        FROM readings
-        """
-    ).fetchone()
+        stats["today"] = row
+
+    row = fetch_one(conn, SQL_STATS_ALL_TIME)
     if row:
-        stats["all_time"] = dict(row)
-
-    rows = conn.execute(
-        """
-        SELECT date(timestamp) AS date, MAX(energy_today_kwh) AS energy_kwh
-        FROM readings GROUP BY date(timestamp)
-        ORDER BY date DESC LIMIT 7
-        """
-    ).fetchall()
-    stats["last_7_days"] = [dict(r) for r in rows]
-
-    conn.close()
-    return jsonify(stats)
+        stats["all_time"] = row
+
+    cursor = conn.execute(SQL_STATS_LAST_7_DAYS)
+    cols = columns(cursor)
+    stats["last_7_days"] = [dict(zip(cols, r)) for r in cursor]
+
+    return json_response(stats)
 
 
 # ---------------------------------------------------------------------------
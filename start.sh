@@ -9,14 +9,26 @@ python collector.py &
 COLLECTOR_PID=$!
 echo "Collector started (PID $COLLECTOR_PID)"
 
-# Start the dashboard (gunicorn) in the foreground
+# Start the dashboard (gunicorn) in the background as well, so this shell
+# stays PID 1 and can forward `docker stop`'s SIGTERM to both processes --
+# the collector flushes its queued readings on SIGTERM.
 # WEB_HOST/WEB_PORT default to 0.0.0.0:5000 if not set (see config.py)
 HOST=${WEB_HOST:-0.0.0.0}
 PORT=${WEB_PORT:-5000}
-exec gunicorn \
+gunicorn \
     --bind "${HOST}:${PORT}" \
     --workers 2 \
     --timeout 30 \
     --access-logfile - \
     --error-logfile - \
-    dashboard:app
+    dashboard:app &
+GUNICORN_PID=$!
+
+trap 'kill -TERM "$GUNICORN_PID" "$COLLECTOR_PID" 2>/dev/null || true' TERM INT
+
+# Returns early when the trap fires (or when gunicorn exits on its own);
+# then stop whatever is still running and wait for both to finish.
+wait "$GUNICORN_PID" || true
+kill -TERM "$GUNICORN_PID" "$COLLECTOR_PID" 2>/dev/null || true
+wait "$GUNICORN_PID" || true
+wait "$COLLECTOR_PID" || true